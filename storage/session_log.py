@@ -33,8 +33,9 @@ class SessionLog:
         self.dir = data_dir / "sessions"
         self.retention_days = retention_days
         self._lock = threading.Lock()
-        if self.enabled:
-            self.dir.mkdir(parents=True, exist_ok=True)
+        # 目录延迟到首次写入时创建:构造发生在事件循环上,且多数房间
+        # 要等到首次开播才有场次可写
+        self._dir_ready = False
 
     @property
     def enabled(self) -> bool:
@@ -48,14 +49,22 @@ class SessionLog:
         if not self.enabled:
             return
         try:
+            # 序列化在锁外完成,锁内只做文件写入
+            line = json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
             with self._lock:
+                if not self._dir_ready:
+                    self.dir.mkdir(parents=True, exist_ok=True)
+                    self._dir_ready = True
                 with open(self._path(room_id), "a", encoding="utf-8") as f:
-                    f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    f.write(line)
         except Exception as e:
             logger.warning(f"场次落盘失败(房间 {room_id}): {e}")
 
     def prune(self) -> None:
-        """启动时清理超期场次行(重写文件;损坏行一并丢弃)"""
+        """启动时清理超期场次行(重写文件;损坏行一并丢弃)
+
+        无需清理的文件保持原样,不做重写。
+        """
         if not self.enabled or not self.dir.exists():
             return
         cutoff = time.time() - self.retention_days * 86400
@@ -63,14 +72,21 @@ class SessionLog:
             try:
                 with self._lock:
                     kept = []
+                    dirty = False
                     with open(path, encoding="utf-8") as f:
                         for line in f:
                             try:
                                 event = json.loads(line)
                                 if float(event.get("ts", 0)) >= cutoff:
                                     kept.append(line.rstrip("\n"))
+                                    # 缺换行的末行须补齐,否则下次追加会粘连
+                                    dirty = dirty or not line.endswith("\n")
+                                    continue
                             except (ValueError, TypeError):
-                                continue  # 损坏行丢弃
+                                pass  # 损坏行丢弃
+                            dirty = True
+                    if not dirty:
+                        continue  # 无超期/损坏行:跳过重写
                     tmp = path.with_suffix(".jsonl.tmp")
                     with open(tmp, "w", encoding="utf-8") as f:
                         f.write("\n".join(kept) + ("\n" if kept else ""))
@@ -495,6 +495,8 @@ def test_session_log_append_and_prune(data_dir):
     from astrbot_plugin_douyu_live.storage.session_log import SessionLog
 
     log = SessionLog(Path(data_dir), retention_days=90)
+    log.prune()  # 目录尚未创建时清理为空操作
+    assert not (Path(data_dir) / "sessions").exists()
     old_ts = time.time() - 100 * 86400
     log.append(940, {"e": "start", "ts": old_ts, "title": "旧", "cat": ""})
     log.append(940, {"e": "start", "ts": time.time(), "title": "新", "cat": "x"})
@@ -506,6 +508,13 @@ def test_session_log_append_and_prune(data_dir):
         .splitlines()
     )
     assert len(lines) == 1 and "新" in lines[0]
+    assert lines[0].startswith('{"e":"start","ts":')  # 紧凑行格式
+
+    # 无超期行的文件不重写(inode 不变)
+    path = Path(data_dir) / "sessions" / "940.jsonl"
+    inode = path.stat().st_ino
+    log.prune()
+    assert path.stat().st_ino == inode
 
     disabled = SessionLog(Path(data_dir), retention_days=0)
     assert not disabled.enabled